@@ -4,4 +4,4 @@ __author__ = """Marcsello Hooves"""
 __email__ = 'punkosdmarcell@rocketmail.com'
 __version__ = '0.1.1'
 
-from .bettersocket import BetterSocketIO, BetterSocketReader, BetterSocketWriter
+from .bettersocket import AsyncBetterSocketIO, BetterSocketIO, BetterSocketReader, BetterSocketWriter, FramePool
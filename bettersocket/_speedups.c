@@ -0,0 +1,103 @@
+/*
+ * Optional C accelerator for bettersocket.
+ * The pure Python implementation in bettersocket.py is used when this is not compiled.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <string.h>
+
+/*
+ * Finds the first occurrence of the delimiter in [p, end), using memchr for the first byte.
+ */
+static const char *
+find_delimiter(const char *p, const char *end, const char *delimiter, Py_ssize_t dlen)
+{
+    while ((p = memchr(p, delimiter[0], end - p)) != NULL) {
+        if (end - p < dlen) {
+            return NULL;
+        }
+        if (memcmp(p, delimiter, dlen) == 0) {
+            return p;
+        }
+        p++;
+    }
+    return NULL;
+}
+
+/*
+ * split_frames(buffer, delimiter, head, scanned, end) -> (frames, head)
+ *
+ * Collects every complete frame from buffer[head:end], starting the first search at scanned.
+ * Returns the list of frames (as bytes, without the delimiters) and the offset after the last delimiter found.
+ */
+static PyObject *
+split_frames(PyObject *self, PyObject *args)
+{
+    Py_buffer view;
+    const char *delimiter;
+    Py_ssize_t dlen, head, scanned, end_offset;
+
+    if (!PyArg_ParseTuple(args, "y*y#nnn:split_frames", &view, &delimiter, &dlen, &head, &scanned, &end_offset)) {
+        return NULL;
+    }
+
+    if (dlen < 1) {
+        PyBuffer_Release(&view);
+        PyErr_SetString(PyExc_ValueError, "Delimiter must be at least 1 byte long");
+        return NULL;
+    }
+
+    if (head < 0 || scanned < head || end_offset < scanned || end_offset > view.len) {
+        PyBuffer_Release(&view);
+        PyErr_SetString(PyExc_ValueError, "Offsets out of range");
+        return NULL;
+    }
+
+    const char *buf = (const char *) view.buf;
+    PyObject *frames = PyList_New(0);
+    if (frames == NULL) {
+        PyBuffer_Release(&view);
+        return NULL;
+    }
+
+    const char *end = buf + end_offset;
+    const char *p = find_delimiter(buf + scanned, end, delimiter, dlen);
+    while (p != NULL) {
+        Py_ssize_t pos = p - buf;
+
+        PyObject *frame = PyBytes_FromStringAndSize(buf + head, pos - head);
+        if (frame == NULL || PyList_Append(frames, frame) < 0) {
+            Py_XDECREF(frame);
+            Py_DECREF(frames);
+            PyBuffer_Release(&view);
+            return NULL;
+        }
+        Py_DECREF(frame);
+
+        head = pos + dlen; /* skip delimiter */
+        p = find_delimiter(buf + head, end, delimiter, dlen);
+    }
+
+    PyBuffer_Release(&view);
+    return Py_BuildValue("(Nn)", frames, head);
+}
+
+static PyMethodDef speedups_methods[] = {
+    {"split_frames", split_frames, METH_VARARGS, "Collects every complete frame from the buffer."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef speedups_module = {
+    PyModuleDef_HEAD_INIT,
+    "bettersocket._speedups",
+    "Optional C accelerator for bettersocket.",
+    -1,
+    speedups_methods
+};
+
+PyMODINIT_FUNC
+PyInit__speedups(void)
+{
+    return PyModule_Create(&speedups_module);
+}
@@ -1,7 +1,96 @@
 #!/usr/bin/env python3
+import asyncio
+import collections
 import socket
 import select
-from typing import Optional
+from typing import List, Optional, Tuple
+
+try:
+    import ssl
+except ImportError:  # Python may be built without it
+    ssl = None
+
+
+_READONLY_VIEWS = hasattr(memoryview, "toreadonly")  # Python 3.8+
+
+# raised by a non-blocking socket that can not accept more data
+_WOULD_BLOCK = (BlockingIOError,) if ssl is None else (BlockingIOError, ssl.SSLWantWriteError)
+
+
+def _is_ssl(sock: socket.socket) -> bool:
+    # SSL sockets have recvmsg_into and sendmsg, but they always raise NotImplementedError
+    return ssl is not None and isinstance(sock, ssl.SSLSocket)
+
+
+def _split_frames_py(buf: bytearray, delimiter: bytes, head: int, scanned: int, end: int) -> Tuple[List[bytes], int]:
+    """
+    Collects every complete frame from buf[head:end], starting the first search at scanned.
+    Returns the frames and the offset after the last delimiter found.
+    """
+
+    dlen = len(delimiter)
+    needle = delimiter[0] if dlen == 1 else delimiter
+
+    if dlen == 1:  # a single split in C instead of a find for every frame
+        last = buf.rfind(needle, scanned, end)
+        if last < 0:
+            return [], head
+
+        with memoryview(buf) as mv:
+            return bytes(mv[head:last]).split(delimiter), last + 1
+
+    # rfind could land inside a self-overlapping multi-byte delimiter, so those are searched frame by frame
+    # hot loop, so everything is looked up only once
+    find = buf.find
+    frames = []
+    append = frames.append
+
+    with memoryview(buf) as mv:
+        pos = find(needle, scanned, end)
+        while pos >= 0:
+            append(bytes(mv[head:pos]))
+            head = pos + dlen  # skip delimiter
+            pos = find(needle, head, end)
+
+    return frames, head
+
+
+try:
+    from ._speedups import split_frames as _split_frames
+except ImportError:  # the C accelerator is optional
+    _split_frames = _split_frames_py
+
+
+class FramePool(object):
+    """
+    A pool of reusable bytearrays, to avoid allocating a new buffer for every frame.
+
+    Buffers are handed out by acquire, and should be given back with release when they are no longer used.
+    The pool can be shared between readers.
+    """
+
+    def __init__(self, maxsize: int = 64):
+        self._free = collections.deque(maxlen=maxsize)  # the oldest buffers are dropped when the pool is full
+
+    def acquire(self, size: int) -> bytearray:
+        """
+        Returns a buffer at least size bytes long.
+        """
+        try:
+            buf = self._free.pop()
+        except IndexError:
+            return bytearray(size)
+
+        if len(buf) < size:
+            return bytearray(size)  # the small one is dropped, so the pool adapts to the frame sizes
+
+        return buf
+
+    def release(self, buf: bytearray):
+        """
+        Gives back a buffer to the pool. It must not be used after this call.
+        """
+        self._free.append(buf)
 
 
 class BetterSocketReader(object):
@@ -9,75 +98,398 @@ class BetterSocketReader(object):
     This is a wrapper for low-level sockets, for reading delimited frames.
 
     Both blocking and non-blocking sockets work out of the box.
+
+    Received data is stored in a ring buffer, so consumed frames never have to be shifted out of it.
+    Where available, recvmsg_into is used to fill both free parts of the ring with a single call.
+
+    With adaptive_chunksize the chunksize arguments are ignored, and the size of each receive is derived from the
+    average size of the frames seen so far instead.
     """
 
-    def __init__(self, sock: socket.socket, delimiter: bytes = b"\n"):
+    __slots__ = ("_sock", "_pool", "_recv", "_recvmsg", "_buffer", "_mv", "_delimiter", "_delimiter_len", "_needle",
+                 "_head", "_size", "_scanned", "_view", "_adaptive", "_avg_frame")
 
-        if len(delimiter) != 1:
-            raise ValueError("Delimiter must be 1 byte long")
+    MIN_CHUNKSIZE = 256
+    MAX_CHUNKSIZE = 256 * 1024
+    MIN_CAPACITY = 1024
+    MAX_IDLE_CAPACITY = 1024 * 1024  # larger rings are freed when they become empty
+
+    def __init__(self, sock: socket.socket, delimiter: bytes = b"\n", pool: Optional[FramePool] = None,
+                 adaptive_chunksize: bool = False):
+
+        if len(delimiter) < 1:
+            raise ValueError("Delimiter must be at least 1 byte long")
 
         if not isinstance(sock, socket.socket):
             raise TypeError("Socket must be an instance of socket.socket")
 
         self._sock = sock
-        self._buffer = bytes()
+        self._pool = pool  # created on first use when not given, most readers never use it
+        self._recv = sock.recv_into  # bound once, used on every read
+        self._recvmsg = None if _is_ssl(sock) else getattr(sock, "recvmsg_into", None)  # not available everywhere
+        self._buffer = bytearray()  # the ring, its capacity is always a power of two (allocated on first receive)
+        self._mv = memoryview(self._buffer)
         self._delimiter = delimiter
+        self._delimiter_len = len(delimiter)
+        # searching for an int skips the length check of a bytes needle
+        self._needle = delimiter[0] if len(delimiter) == 1 else delimiter
+        self._head = 0  # offset of the first not yet consumed byte in the ring
+        self._size = 0  # number of not yet consumed bytes in the ring
+        self._scanned = 0  # number of bytes after the head already known to be free of delimiters
+        self._view = None  # the last view returned by readframe_view
+        self._adaptive = adaptive_chunksize
+        self._avg_frame = 512.0  # moving average of the frame sizes, starts from the default chunksize
+
+    def _find_frame(self) -> int:
+        """
+        Returns the length of the first complete frame after the head, or -1 if there is none yet.
+        """
+
+        buf = self._buffer
+        head = self._head
+        end = head + self._size
+
+        if end <= len(buf):  # the data is contiguous, this is the common case
+            pos = buf.find(self._needle, head + self._scanned, end)  # do not rescan the already searched part
+            if pos >= 0:
+                return pos - head
+        else:
+            pos = self._find_wrapped(self._scanned)
+            if pos >= 0:
+                return pos
+
+        return -1
+
+    def _find_wrapped(self, start: int) -> int:
+        """
+        Same as _find_frame, but for data wrapping around the end of the ring, searching from start bytes after the head.
+        """
+
+        buf = self._buffer
+        cap = len(buf)
+        head = self._head
+        pos = head + start
+        end = head + self._size
+
+        if pos < cap:  # search the part before the end of the ring first
+            found = buf.find(self._needle, pos, cap)
+            if found >= 0:
+                return found - head
+
+            if self._delimiter_len > 1:  # the delimiter itself may be split by the end of the ring
+                edge = max(pos, cap - self._delimiter_len + 1)
+                joined = bytes(self._mv[edge:]) + bytes(self._mv[:min(self._delimiter_len - 1, end - cap)])
+                found = joined.find(self._delimiter)
+                if found >= 0:
+                    return edge + found - head
+
+            pos = cap
+
+        found = buf.find(self._needle, pos - cap, end - cap)
+        return found + cap - head if found >= 0 else -1
+
+    def _consume(self, n: int):
+        """
+        Marks the first n bytes after the head consumed.
+        """
+
+        self._size -= n
+        self._scanned = 0
+        if self._size:
+            self._head = (self._head + n) & (len(self._buffer) - 1)
+        else:
+            self._head = 0  # start over from the beginning, so the data stays contiguous as long as possible
+            if len(self._buffer) > self.MAX_IDLE_CAPACITY:
+                self._shrink()
+
+    def _parts(self, start: int, length: int) -> List[memoryview]:
+        """
+        Returns the frame at the given position of the ring, split into two parts if it wraps around.
+        """
+
+        end = start + length
+        cap = len(self._buffer)
+        if end <= cap:
+            return [self._mv[start:end]]
+
+        return [self._mv[start:], self._mv[:end - cap]]
+
+    def _observe(self, size: float):
+        self._avg_frame += (size - self._avg_frame) / 8  # exponentially weighted, so it follows changes in traffic
+
+    def _release_view(self):
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+
+    def _shrink(self):
+        """
+        Frees the ring, a single large frame should not keep it large forever. It must be empty.
+        """
+
+        self._buffer = bytearray()  # views returned earlier keep the old one alive as long as they need it
+        self._mv = memoryview(self._buffer)
+        self._head = 0
+
+    def _grow(self, needed: int):
+        """
+        Replaces the ring with a larger one, the data is moved to the beginning of it.
+        """
+
+        cap = self.MIN_CAPACITY
+        while cap < needed:
+            cap *= 2
+
+        buf = bytearray(cap)
+        off = 0
+        for part in self._parts(self._head, self._size):
+            buf[off:off + len(part)] = part  # same length, so the buffer is not resized
+            off += len(part)
+
+        self._buffer = buf
+        self._mv = memoryview(buf)
+        self._head = 0
+
+    def _receive(self, chunksize: int) -> bool:
+        """
+        Receives one chunk into the ring. Returns False if there was nothing to read.
+        """
+
+        if self._adaptive:
+            chunksize = min(max(int(self._avg_frame * 2), self.MIN_CHUNKSIZE), self.MAX_CHUNKSIZE)
+
+        size = self._size
+        # only called when no frame was found, so everything but the beginning of a split delimiter was searched
+        scanned = size - self._delimiter_len + 1
+        self._scanned = scanned if scanned > 0 else 0
+
+        if len(self._buffer) - size < chunksize:  # make sure a whole chunk fits
+            self._grow(size + chunksize)
+
+        mv = self._mv
+        cap = len(mv)
+        tail = self._head + size
+
+        try:
+            if tail >= cap:  # the data wraps around, the free space is between the two parts
+                n = self._recv(mv[tail - cap:self._head], chunksize)
+            elif tail + chunksize <= cap:
+                n = self._recv(mv[tail:], chunksize)
+            elif self._recvmsg is None:
+                n = self._recv(mv[tail:])  # only until the end of the ring
+            else:  # the free space wraps around, receive into both parts at once
+                n = self._recvmsg([mv[tail:], mv[:chunksize - (cap - tail)]])[0]
+        except (BlockingIOError, socket.timeout):  # nothing to read, everything else should be raised
+            return False
+
+        if n:
+            self._size = size + n
+            return True
+        else:
+            raise ConnectionResetError()  # zero bytes are only received when the connection is dropped (otherwise it would have returned)
+
+    def _read(self, chunksize: int) -> int:
+        """
+        Returns the length of the first complete frame after the head, receiving one chunk if there is none yet.
+        Returns -1 if there is still no complete frame. The frame is not consumed.
+        """
+
+        if self._view is not None:
+            self._release_view()
+
+        pos = self._find_frame()  # before receive, check if there is a valid data in the buffer
+        if pos < 0:
+            # actual receiving won't start until there is no more valid message left in the buffer
+            if not self._receive(chunksize):
+                return -1
+
+            pos = self._find_frame()  # and check if a valid message received
+            if pos < 0:
+                return -1
+
+        if self._adaptive:  # batches are observed by _pop_all_from_buffer instead
+            self._observe(pos)
+
+        return pos
+
+    def _pop_all_from_buffer(self) -> List[bytes]:
+        """
+        Returns all complete frames in the ring, and marks them consumed.
+        """
+
+        size = self._size
+        if not size:
+            return []
+
+        buf = self._buffer
+        head = self._head
+        end = head + size
+        if end > len(buf):
+            frames = self._pop_all_wrapped()
+        else:  # the data is contiguous, this is the common case
+            frames, new_head = _split_frames(buf, self._delimiter, head, head + self._scanned, end)
+            if frames:
+                self._consume(new_head - head)
+
+        if self._adaptive and frames:
+            self._observe(sum(map(len, frames)) / len(frames))  # once per batch, not per frame
+
+        return frames
+
+    def _pop_all_wrapped(self) -> List[bytes]:
+        """
+        Same as _pop_all_from_buffer, but for data wrapping around the end of the ring.
+        """
+
+        frames = []
 
-    def _pop_one_from_buffer(self) -> Optional[bytes]:
+        while self._size:
+            head = self._head
+            cap = len(self._buffer)
+            wrapped = head + self._size > cap
+            end = min(head + self._size, cap)  # the contiguous part
 
-        if self._delimiter in self._buffer:
-            pos = self._buffer.find(self._delimiter)
+            batch, new_head = _split_frames(self._buffer, self._delimiter, head, min(head + self._scanned, end), end)
+            if batch:
+                frames += batch
+                self._consume(new_head - head)
 
-            data = self._buffer[:pos]  # data from the beginning until the delimtiter
-            self._buffer = self._buffer[pos + 1:]  # skip delimiter
+            if not wrapped:
+                break
 
-            return data
+            # the frame crossing the end of the ring is handled separately
+            pos = self._find_frame()
+            if pos < 0:
+                break
 
-        return None
+            frames.append(b"".join(self._parts(self._head, pos)))
+            self._consume(pos + self._delimiter_len)  # skip delimiter
+
+        return frames
 
     def reset(self):
         """
         This call clears the internal buffer of the instance.
         This does not clear the kernel buffer.
         """
-        self._buffer = bytes()
+        self._release_view()
+        self._size = 0
+        self._scanned = 0
+        self._shrink()
 
-    def readframe(self, chunksize: int = 1024) -> Optional[str]:
+    def readframe(self, chunksize: int = 1024) -> Optional[bytes]:
         """
         Returns one frame of data between delimiters (without the delimiters)
         Returns None if nothing to read (no delimiter received)
         """
 
-        data = self._pop_one_from_buffer()  # before receive, check if there is a valid data in the buffer
-        if data:
-            return data
+        pos = self._read(chunksize)
+        if pos < 0:
+            return None
 
-        # actual receiving won't start until there is no more valid message left in the buffer
+        start = self._head
+        cap = len(self._buffer)
+        if start + pos <= cap:  # contiguous, sliced directly
+            data = self._mv[start:start + pos].tobytes()
+        else:
+            data = b"".join(self._parts(start, pos))
+
+        # same as _consume, inlined as this is the hot path
+        n = pos + self._delimiter_len  # skip delimiter
+        size = self._size - n
+        self._size = size
+        self._scanned = 0
+        if size:
+            self._head = (start + n) & (cap - 1)
+        else:
+            self._head = 0
+            if cap > self.MAX_IDLE_CAPACITY:
+                self._shrink()
 
-        try:
-            chunk = self._sock.recv(chunksize)  # receive a chunk
-        except socket.timeout:
+        return data
+
+    def readframe_view(self, chunksize: int = 1024) -> Optional[memoryview]:
+        """
+        Same as readframe, but returns a memoryview over the internal buffer instead of a copy.
+        Frames wrapping around the end of the ring buffer are copied, so they can be returned as a single view.
+        The view is only valid until the next read or reset call on this instance, after that it is released.
+        The view is read-only on Python 3.8 and newer. Older versions can not make a view of a bytearray read-only,
+        so there views of frames not wrapping around are writable, but must not be modified either.
+        No views derived from it should be kept.
+        """
+
+        length = self._read(chunksize)
+        if length < 0:
             return None
-        except socket.error as e:
-            if e.errno == socket.errno.EWOULDBLOCK:  # nothing to read
-                return None
-            else:
-                raise  # everything else should be raised
-
-        if chunk:
-            self._buffer += chunk  # append the received chunk to the buffer
-            return self._pop_one_from_buffer()  # and check if a valid message received
-        else:
-            raise ConnectionResetError()  # chunk is only none when the connection is dropped (otherwise it would have returned)
+
+        start = self._head
+        if start + length <= len(self._buffer):  # contiguous, sliced directly
+            view = self._mv[start:start + length]
+            self._view = view.toreadonly() if _READONLY_VIEWS else view
+        else:  # a view of bytes is always read-only
+            self._view = memoryview(b"".join(self._parts(start, length)))
+
+        self._consume(length + self._delimiter_len)  # the frame stays in the ring until the next receive
+        return self._view
+
+    def _frame_pool(self) -> FramePool:
+        if self._pool is None:
+            self._pool = FramePool()
+
+        return self._pool
+
+    def readframe_pooled(self, chunksize: int = 1024) -> Optional[Tuple[bytearray, int]]:
+        """
+        Same as readframe, but copies the frame into a buffer from the pool instead of allocating a new one.
+        Returns the buffer and the length of the frame in it (the buffer may be longer).
+        The buffer should be given back with releaseframe when it is no longer used.
+        """
+
+        length = self._read(chunksize)
+        if length < 0:
+            return None
+
+        buf = self._frame_pool().acquire(length)
+        off = 0
+        for part in self._parts(self._head, length):
+            buf[off:off + len(part)] = part  # same length, so the buffer is not resized
+            off += len(part)
+
+        self._consume(length + self._delimiter_len)
+        return buf, length
+
+    def releaseframe(self, buf: bytearray):
+        """
+        Gives back a buffer returned by readframe_pooled.
+        """
+        self._frame_pool().release(buf)
+
+    def readframes(self, chunksize: int = 1024) -> List[bytes]:
+        """
+        Returns all complete frames available (without the delimiters)
+        Receives at most one chunk, and only if there are no complete frames in the buffer already.
+        Returns an empty list if nothing to read.
+        """
+
+        if self._view is not None:
+            self._release_view()
+
+        frames = self._pop_all_from_buffer()
+        if not frames and self._receive(chunksize):
+            frames = self._pop_all_from_buffer()
+
+        return frames
 
 
 class BetterSocketWriter(object):
     """
     This is a wrapper for low-level sockets, for sending delimited frames.
 
-    Both blocking and non-blocking sockets supported out of the box. Either way it waits for the socket to became ready.
+    Both blocking and non-blocking sockets supported out of the box. Either way sending blocks until all the data is sent.
     """
 
+    __slots__ = ("_sock", "_delimiter", "_nonblocking", "_scatter")
+
     def __init__(self, sock: socket.socket, delimiter: bytes = b"\n"):
 
         if not isinstance(sock, socket.socket):
@@ -85,24 +497,54 @@ class BetterSocketWriter(object):
 
         self._sock = sock
         self._delimiter = delimiter
+        self._nonblocking = sock.gettimeout() == 0.0  # the blocking mode is checked only once
+        self._scatter = hasattr(sock, "sendmsg") and not _is_ssl(sock)  # not available everywhere
 
     def rawsendall(self, data: bytes):
         """
-        This call is blocks until the socket is ready. Then sends the data.
+        This call blocks until all the data is sent.
+        Non-blocking sockets are only waited for when they can not accept more data.
         Does not append the delimiter.
         """
 
-        writable = select.select([], [self._sock], [])[1]
+        if not self._nonblocking:
+            self._sock.sendall(data)  # sendall already blocks until everything is sent
+            return
 
-        if writable:
-            self._sock.sendall(data)
+        with memoryview(data) as mv:
+            off = 0
+            while off < mv.nbytes:
+                try:
+                    off += self._sock.send(mv[off:])
+                except _WOULD_BLOCK:
+                    select.select([], [self._sock], [])  # wait only when the kernel buffer is full
 
     def sendframe(self, data: bytes):
         """
         This call automatically appends the delimiter to the end of the data.
-        blocks until the socket is ready.
+        This call blocks until all the data is sent.
+        Non-blocking sockets are only waited for when they can not accept more data.
         """
-        self.rawsendall(data + self._delimiter)
+
+        if not self._scatter:
+            self.rawsendall(data + self._delimiter)
+            return
+
+        with memoryview(data) as mv:
+
+            while True:
+                try:
+                    sent = self._sock.sendmsg([mv, self._delimiter])  # let the kernel gather the data and the delimiter
+                    break
+                except BlockingIOError:
+                    select.select([], [self._sock], [])
+
+            if sent < mv.nbytes:  # partial sends are rare, finish them off with the regular path
+                self.rawsendall(mv[sent:])
+                sent = mv.nbytes
+
+            if sent - mv.nbytes < len(self._delimiter):
+                self.rawsendall(self._delimiter[sent - mv.nbytes:])
 
 
 class BetterSocketIO(object):
@@ -110,37 +552,96 @@ class BetterSocketIO(object):
     This class combines BetterSocketReader and BetterSocketWriter together.
     Functions from both classes are exposed.
     This is the recommended wrapper to use.
+
+    The reader and the writer are only created when they are first used.
     """
 
-    def __init__(self, sock: socket.socket, delimiter: bytes = b"\n"):
+    __slots__ = ("_socket", "_delimiter", "_pool", "_adaptive_chunksize", "_reader", "_writer")
+
+    def __init__(self, sock: socket.socket, delimiter: bytes = b"\n", pool: Optional[FramePool] = None,
+                 adaptive_chunksize: bool = False):
+
+        if len(delimiter) < 1:
+            raise ValueError("Delimiter must be at least 1 byte long")
+
+        if not isinstance(sock, socket.socket):
+            raise TypeError("Socket must be an instance of socket.socket")
 
         self._socket = sock
-        self._reader = BetterSocketReader(sock, delimiter)
-        self._writer = BetterSocketWriter(sock, delimiter)
+        self._delimiter = delimiter
+        self._pool = pool
+        self._adaptive_chunksize = adaptive_chunksize
+        self._reader = None
+        self._writer = None
+
+    @property
+    def reader(self) -> BetterSocketReader:
+        """
+        The BetterSocketReader of the socket
+        """
+        if self._reader is None:
+            self._reader = BetterSocketReader(self._socket, self._delimiter, self._pool, self._adaptive_chunksize)
+
+        return self._reader
+
+    @property
+    def writer(self) -> BetterSocketWriter:
+        """
+        The BetterSocketWriter of the socket
+        """
+        if self._writer is None:
+            self._writer = BetterSocketWriter(self._socket, self._delimiter)
+
+        return self._writer
 
     def readframe(self, chunksize: int = 1024) -> Optional[bytes]:
         """
         Same as BetterSocketReader.readframe
         """
-        return self._reader.readframe(chunksize)
+        return self.reader.readframe(chunksize)
+
+    def readframe_view(self, chunksize: int = 1024) -> Optional[memoryview]:
+        """
+        Same as BetterSocketReader.readframe_view
+        """
+        return self.reader.readframe_view(chunksize)
+
+    def readframe_pooled(self, chunksize: int = 1024) -> Optional[Tuple[bytearray, int]]:
+        """
+        Same as BetterSocketReader.readframe_pooled
+        """
+        return self.reader.readframe_pooled(chunksize)
+
+    def releaseframe(self, buf: bytearray):
+        """
+        Same as BetterSocketReader.releaseframe
+        """
+        self.reader.releaseframe(buf)
+
+    def readframes(self, chunksize: int = 1024) -> List[bytes]:
+        """
+        Same as BetterSocketReader.readframes
+        """
+        return self.reader.readframes(chunksize)
 
     def rawsendall(self, data: bytes):
         """
         Same as BetterSocketWriter.rawsendall
         """
-        self._writer.rawsendall(data)
+        self.writer.rawsendall(data)
 
     def sendframe(self, data: bytes):
         """
         Same as BetterSocketWriter.sendframe
         """
-        self._writer.sendframe(data)
+        self.writer.sendframe(data)
 
     def reset(self):
         """
         Same as BetterSocketReader.reset
         """
-        self._reader.reset()
+        if self._reader is not None:  # nothing to clear otherwise
+            self._reader.reset()
 
     def close(self):
         """
@@ -166,3 +667,69 @@ class BetterSocketIO(object):
 
     def __repr__(self) -> str:
         return f"<{str(self)}>"
+
+
+class AsyncBetterSocketIO(object):
+    """
+    This is an asyncio counterpart of BetterSocketIO, on top of asyncio streams.
+    Waiting is done by the event loop, so many sockets can be handled without a select call for each of them.
+
+    Use AsyncBetterSocketIO.from_socket to wrap an existing socket.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, delimiter: bytes = b"\n"):
+
+        if len(delimiter) < 1:
+            raise ValueError("Delimiter must be at least 1 byte long")
+
+        self._reader = reader
+        self._writer = writer
+        self._delimiter = delimiter
+
+    @classmethod
+    async def from_socket(cls, sock: socket.socket, delimiter: bytes = b"\n", limit: int = 2 ** 16) -> "AsyncBetterSocketIO":
+        """
+        Wraps an already connected socket. The socket is switched to non-blocking mode by the event loop.
+        The limit is the maximum length of a frame.
+        """
+
+        if not isinstance(sock, socket.socket):
+            raise TypeError("Socket must be an instance of socket.socket")
+
+        reader, writer = await asyncio.open_connection(sock=sock, limit=limit)
+        return cls(reader, writer, delimiter)
+
+    async def readframe(self) -> bytes:
+        """
+        Waits for one frame of data between delimiters, and returns it (without the delimiters)
+        """
+
+        try:
+            data = await self._reader.readuntil(self._delimiter)
+        except asyncio.IncompleteReadError:
+            raise ConnectionResetError()  # the connection is dropped before a delimiter arrived
+
+        return data[:-len(self._delimiter)]
+
+    async def rawsendall(self, data: bytes):
+        """
+        Sends the data, and waits until the socket is ready to accept more.
+        Does not append the delimiter.
+        """
+        self._writer.write(data)
+        await self._writer.drain()
+
+    async def sendframe(self, data: bytes):
+        """
+        This call automatically appends the delimiter to the end of the data.
+        Waits until the socket is ready to accept more.
+        """
+        self._writer.writelines((data, self._delimiter))
+        await self._writer.drain()
+
+    def close(self):
+        """
+        Closes the underlying transport and socket.
+        After this call no further calls should be attempted.
+        """
+        self._writer.close()
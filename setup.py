@@ -2,7 +2,7 @@
 
 """The setup script."""
 
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
 
 with open('README.rst') as readme_file:
     readme = readme_file.read()
@@ -31,6 +31,7 @@ setup(
         'Programming Language :: Python :: 3.8',
     ],
     description="Better socket handling for Python3",
+    ext_modules=[Extension('bettersocket._speedups', sources=['bettersocket/_speedups.c'], optional=True)],
     install_requires=requirements,
     license="MIT license",
     long_description=readme + '\n\n' + history,
@@ -3,19 +3,341 @@
 """Tests for `bettersocket` package."""
 
 
+import asyncio
+import os
+import socket
+import ssl
+import threading
 import unittest
 
 from bettersocket import bettersocket
 
+KEYCERT = os.path.join(os.path.dirname(__file__), "keycert.pem")  # self-signed, for localhost
+
+
+def tls_socketpair():
+    """Returns a connected pair of TLS sockets (server side, client side)."""
+    server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    server_context.load_cert_chain(KEYCERT)
+    client_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    client_context.check_hostname = False
+    client_context.verify_mode = ssl.CERT_NONE
+
+    remote, local = socket.socketpair()
+    server = []
+    handshake = threading.Thread(target=lambda: server.append(server_context.wrap_socket(remote, server_side=True)))
+    handshake.start()
+    client = client_context.wrap_socket(local)
+    handshake.join()
+    return server[0], client
+
 
 class TestBettersocket(unittest.TestCase):
     """Tests for `bettersocket` package."""
 
     def setUp(self):
         """Set up test fixtures, if any."""
+        self.remote, self.local = socket.socketpair()
+        self.local.setblocking(False)
+        self.bs = bettersocket.BetterSocketIO(self.local)
 
     def tearDown(self):
         """Tear down test fixtures, if any."""
+        self.remote.close()
+        self.bs.close()
+
+    def test_000_readframe(self):
+        """Test reading frames split across multiple chunks."""
+        self.remote.sendall(b"hel")
+        self.assertIsNone(self.bs.readframe())
+        self.remote.sendall(b"lo\n\nworld\n")
+        self.assertEqual(self.bs.readframe(), b"hello")
+        self.assertEqual(self.bs.readframe(), b"")
+        self.assertEqual(self.bs.readframe(), b"world")
+        self.assertIsNone(self.bs.readframe())
+
+    def test_001_readframe_view(self):
+        """Test that views are released on the next read."""
+        self.remote.sendall(b"ab\ncd\n")
+        view = self.bs.readframe_view()
+        self.assertEqual(bytes(view), b"ab")
+        if hasattr(memoryview, "toreadonly"):  # Python 3.8+
+            self.assertTrue(view.readonly)
+        self.assertEqual(bytes(self.bs.readframe_view()), b"cd")
+        with self.assertRaises(ValueError):
+            bytes(view)
+
+    def test_002_sendframe(self):
+        """Test that the delimiter is appended."""
+        self.bs.sendframe(b"hello")
+        self.assertEqual(self.remote.recv(16), b"hello\n")
+
+    def test_003_readframes(self):
+        """Test draining every complete frame at once."""
+        self.assertEqual(self.bs.readframes(), [])
+        self.remote.sendall(b"a\nb\n\nc")
+        self.assertEqual(self.bs.readframes(), [b"a", b"b", b""])
+        self.remote.sendall(b"d\n")
+        self.assertEqual(self.bs.readframe(), b"cd")
+
+    def test_004_multibyte_delimiter(self):
+        """Test delimiters longer than one byte, split across chunks."""
+        bs = bettersocket.BetterSocketIO(self.local, b"\r\n")
+        self.remote.sendall(b"GET / HTTP/1.1\r")
+        self.assertIsNone(bs.readframe())
+        self.remote.sendall(b"\nHost: a\r\n\r\n")
+        self.assertEqual(bs.readframe(), b"GET / HTTP/1.1")
+        self.assertEqual(bs.readframes(), [b"Host: a", b""])
+        bs.sendframe(b"ok")
+        self.assertEqual(self.remote.recv(16), b"ok\r\n")
+
+    def test_005_async(self):
+        """Test the asyncio wrapper."""
+
+        async def run():
+            conn = await bettersocket.AsyncBetterSocketIO.from_socket(self.local)
+            self.remote.sendall(b"hello\nwor")
+            self.assertEqual(await conn.readframe(), b"hello")
+            self.remote.sendall(b"ld\n")
+            self.assertEqual(await conn.readframe(), b"world")
+            await conn.sendframe(b"ok")
+            self.assertEqual(self.remote.recv(16), b"ok\n")
+            self.remote.close()
+            with self.assertRaises(ConnectionResetError):
+                await conn.readframe()
+            conn.close()
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(run())
+        finally:
+            loop.close()
+
+    def test_006_readframe_pooled(self):
+        """Test that pooled buffers are reused."""
+        self.remote.sendall(b"x\nhello\nab\n")
+        self.assertEqual(self.bs.readframe(), b"x")
+        self.assertIsNone(self.bs.reader._pool)  # not created until a pooled read
+        buf, length = self.bs.readframe_pooled()
+        self.assertEqual(buf[:length], b"hello")
+        self.bs.releaseframe(buf)
+        buf2, length = self.bs.readframe_pooled()
+        self.assertIs(buf2, buf)
+        self.assertEqual(buf2[:length], b"ab")
+
+    def test_007_adaptive_chunksize(self):
+        """Test that the chunksize follows the frame sizes."""
+        bs = bettersocket.BetterSocketReader(self.local, adaptive_chunksize=True)
+        frame = b"x" * 4000
+        calls = 0
+        for _ in range(32):
+            self.remote.sendall(frame + b"\n")
+            calls = 1
+            while bs.readframe() is None:
+                calls += 1
+        self.assertEqual(calls, 1)  # the last frame arrived with a single receive
+
+    def test_008_ring_wraparound(self):
+        """Test frames and delimiters crossing the end of the ring buffer."""
+        bs = bettersocket.BetterSocketReader(self.local, b"\r\n")
+        frames = [bytes([65 + i]) * (500 + i * 37) for i in range(20)]
+        self.remote.sendall(b"".join(frame + b"\r\n" for frame in frames))
+        for frame in frames:
+            data = None
+            while data is None:
+                data = bs.readframe(300)
+            self.assertEqual(data, frame)
+
+    def test_009_tls_sendframe(self):
+        """Test sending frames over TLS, where sendmsg is not allowed."""
+        server, client = tls_socketpair()
+        try:
+            bettersocket.BetterSocketIO(client).sendframe(b"hi")
+            data = b""
+            while not data.endswith(b"\n"):
+                data += server.recv(16)
+            self.assertEqual(data, b"hi\n")
+        finally:
+            server.close()
+            client.close()
+
+    def test_010_tls_ring_wraparound(self):
+        """Test receiving over TLS into free space that wraps around the ring, where recvmsg_into is not allowed."""
+        server, client = tls_socketpair()
+        frames = [bytes([65 + i]) * (500 + i * 37) for i in range(20)]
+        sender = threading.Thread(target=server.sendall, args=(b"".join(frame + b"\n" for frame in frames),))
+        sender.start()
+        try:
+            bs = bettersocket.BetterSocketReader(client)
+            for frame in frames:
+                data = None
+                while data is None:
+                    data = bs.readframe(300)
+                self.assertEqual(data, frame)
+        finally:
+            sender.join()
+            server.close()
+            client.close()
+
+    def test_011_adaptive_frames_observed_once(self):
+        """Test that every frame is counted only once in the average frame size, also around the end of the ring."""
+
+        class RecordingReader(bettersocket.BetterSocketReader):
+            __slots__ = ("observed",)
+
+            def _observe(self, size):
+                self.observed.append(size)
+                super()._observe(size)
+
+        bs = RecordingReader(self.local, adaptive_chunksize=True)
+        bs.observed = []
+        frames = [b"x" * (300 + i * 53 % 900) for i in range(40)]
+        self.remote.sendall(b"".join(frame + b"\n" for frame in frames))
+
+        expected = 0
+        received = []
+        while len(received) < len(frames):
+            frame = bs.readframe()
+            if frame is not None:
+                received.append(frame)
+                expected += 1
+            batch = bs.readframes()
+            if batch:
+                received += batch
+                expected += 1  # a batch is observed as a whole
+
+        self.assertEqual(received, frames)
+        self.assertEqual(len(bs.observed), expected)
+
+    def test_012_split_frames(self):
+        """Test that the pure Python and the C frame splitting return the same results."""
+        cases = [
+            # buffer, delimiter, head, scanned, end, expected
+            (b"a\nbb\n\ncc", b"\n", 0, 0, 8, ([b"a", b"bb", b""], 6)),
+            (b"xxa\nb\nc", b"\n", 2, 3, 7, ([b"a", b"b"], 6)),
+            (b"a\nbb\ncc\n", b"\n", 0, 0, 4, ([b"a"], 2)),  # end before the last delimiters
+            (b"abc", b"\n", 0, 0, 3, ([], 0)),
+            (b"a\r\nb\r\r\nc\r", b"\r\n", 0, 0, 9, ([b"a", b"b\r"], 7)),
+            (b"zza\r\nb\r\n", b"\r\n", 2, 3, 8, ([b"a", b"b"], 8)),
+            (b"a\r\nb\r\n", b"\r\n", 0, 0, 5, ([b"a"], 3)),  # end splits the last delimiter
+            (b"aaaaa", b"aa", 0, 0, 5, ([b"", b""], 4)),  # self-overlapping delimiter
+        ]
+
+        implementations = [bettersocket._split_frames_py]
+        try:
+            from bettersocket import _speedups
+            implementations.append(_speedups.split_frames)
+        except ImportError:
+            pass
+
+        for split_frames in implementations:
+            for buf, delimiter, head, scanned, end, expected in cases:
+                with self.subTest(split_frames=split_frames, buf=buf, end=end):
+                    self.assertEqual(split_frames(bytearray(buf), delimiter, head, scanned, end), expected)
+
+    def test_013_nonblocking_large_send(self):
+        """Test sending more than the socket buffer holds through a non-blocking socket."""
+        data = bytes(range(256)) * 16384  # 4 MiB, far more than the socket buffer
+
+        for delimiter in (b"\n", b"\r\n"):
+            with self.subTest(delimiter=delimiter):
+                remote, local = socket.socketpair()
+                local.setblocking(False)
+                expected = data + delimiter + data + delimiter + data
+                received = bytearray()
+
+                def receive():
+                    while len(received) < len(expected):
+                        chunk = remote.recv(65536)
+                        if not chunk:
+                            break
+                        received.extend(chunk)
+
+                receiver = threading.Thread(target=receive, daemon=True)
+                receiver.start()
+                try:
+                    bs = bettersocket.BetterSocketIO(local, delimiter)
+                    bs.sendframe(data)
+                    bs.sendframe(memoryview(data))
+                    bs.rawsendall(data)
+                    receiver.join()
+                    self.assertEqual(received, expected)
+                finally:
+                    remote.close()
+                    local.close()
+
+    def test_014_ring_shrinks(self):
+        """Test that the ring does not stay large after a large frame, or after a reset."""
+        frame = b"x" * (4 * 1024 * 1024)
+        sender = threading.Thread(target=self.remote.sendall, args=(frame + b"\n",))
+        sender.start()
+        try:
+            reader = self.bs.reader
+            data = None
+            while data is None:
+                data = reader.readframe(65536)
+            self.assertEqual(data, frame)
+        finally:
+            sender.join()
+
+        self.assertLessEqual(len(reader._buffer), reader.MAX_IDLE_CAPACITY)
+        self.remote.sendall(b"next\n")
+        self.assertEqual(reader.readframe(), b"next")
+
+        sender = threading.Thread(target=self.remote.sendall, args=(frame,))  # without a delimiter
+        sender.start()
+        try:
+            while sender.is_alive():
+                self.assertIsNone(reader.readframe(65536))
+        finally:
+            sender.join()
+
+        while len(reader._buffer) <= reader.MAX_IDLE_CAPACITY:
+            self.assertIsNone(reader.readframe(65536))
+        reader.reset()
+        self.assertLessEqual(len(reader._buffer), reader.MAX_IDLE_CAPACITY)
+
+    def test_015_adaptive_chunksize_limit(self):
+        """Test that the chunksize does not grow past MAX_CHUNKSIZE with huge frames."""
+        bs = bettersocket.BetterSocketReader(self.local, adaptive_chunksize=True)
+        sizes = []
+        recv = bs._recv
+        bs._recv = lambda buf, nbytes=0: sizes.append(nbytes or len(buf)) or recv(buf, nbytes)
+
+        frame = b"x" * (4 * 1024 * 1024)
+        sender = threading.Thread(target=self.remote.sendall, args=((frame + b"\n") * 4,))
+        sender.start()
+        try:
+            for _ in range(4):
+                data = None
+                while data is None:
+                    data = bs.readframe()
+                self.assertEqual(data, frame)
+        finally:
+            sender.join()
+
+        self.assertEqual(max(sizes), bs.MAX_CHUNKSIZE)
+
+    def test_016_tls_nonblocking_large_send(self):
+        """Test sending more than the socket buffer holds through a non-blocking TLS socket."""
+        server, client = tls_socketpair()
+        client.setblocking(False)
+        data = bytes(range(256)) * 32768  # 8 MiB
+        received = bytearray()
+
+        def receive():
+            while len(received) < len(data) + 1:
+                chunk = server.recv(65536)
+                if not chunk:
+                    break
+                received.extend(chunk)
 
-    def test_000_something(self):
-        """Test something."""
+        receiver = threading.Thread(target=receive, daemon=True)
+        receiver.start()
+        try:
+            bettersocket.BetterSocketIO(client).sendframe(data)
+            receiver.join()
+            self.assertEqual(received, data + b"\n")
+        finally:
+            server.close()
+            client.close()